@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+
+# Modules that must only be loaded when they are first needed
+HEAVY_MODULES = ["gurobipy", "numpy", "pandas", "tabulate", "PyQt5"]
+
+# Worst acceptable median import time, in seconds, for the entry points without a GUI
+IMPORT_BUDGET = 0.05
+# The GUI has to load PyQt5 to define its window, so it gets a larger budget
+GUI_IMPORT_BUDGET = 0.5
+
+# Each entry point, the heavy modules it is still allowed to load at import time and its budget
+ENTRY_POINTS = {
+    "optimization_solver": ([], IMPORT_BUDGET),
+    "tests_knapsack": ([], IMPORT_BUDGET),
+    "tests_planning": ([], IMPORT_BUDGET),
+    "instance_generator": ([], IMPORT_BUDGET),
+    "ihm": (["PyQt5"], GUI_IMPORT_BUDGET),
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure_import(module, repeat=5):
+    """
+    Imports `module` in `repeat` fresh interpreters.
+
+    Returns:
+        A tuple containing:
+            - The median import time (in seconds).
+            - The list of heavy modules loaded by the import.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=here, capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        loaded = output[1].split(",") if len(output) > 1 else []
+    timings.sort()
+    return timings[len(timings) // 2], loaded
+
+
+def run_import_benchmark():
+    results = []
+
+    for module, (allowed, budget) in ENTRY_POINTS.items():
+        try:
+            median, loaded = measure_import(module)
+        except subprocess.CalledProcessError as e:
+            # Only the GUI may be skipped, and only because PyQt5 is not installed
+            missing_qt = module == "ihm" and "ModuleNotFoundError: No module named 'PyQt5'" in e.stderr
+            results.append({
+                "Module": module,
+                "Import Time (s)": None,
+                "Heavy Modules": None,
+                "Status": "SKIPPED" if missing_qt else "FAIL",
+            })
+            if not missing_qt:
+                print(e.stderr, file=sys.stderr)
+            continue
+        unexpected = [name for name in loaded if name not in allowed]
+        too_slow = median > budget
+        results.append({
+            "Module": module,
+            "Import Time (s)": round(median, 4),
+            "Heavy Modules": ", ".join(loaded) or "-",
+            "Status": "FAIL" if unexpected or too_slow else "OK",
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    results = run_import_benchmark()
+    for result in results:
+        print(f"{result['Module']:<22} {str(result['Import Time (s)']):<10} {result['Heavy Modules'] or '':<10} {result['Status']}")
+    sys.exit(1 if any(result["Status"] == "FAIL" for result in results) else 0)
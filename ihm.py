@@ -1,19 +1,22 @@
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel, QTableWidget, QTableWidgetItem,
-    QLineEdit, QMessageBox, QTextEdit, QHBoxLayout, QComboBox, QInputDialog , QHeaderView
+    QLineEdit, QMessageBox, QTextEdit, QHBoxLayout, QComboBox, QInputDialog , QHeaderView, QCheckBox
 )
-from PyQt5.QtGui import QFont, QIcon
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QBrush
-from optimization_solver import solve_knapsack, solve_production
+from PyQt5.QtGui import QFont, QPixmap, QColor, QBrush
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 import sys
 
+# Delay after the last edit before the live mode re-solves, in milliseconds
+LIVE_DEBOUNCE_MS = 300
+
 
 class OptimizationApp(QMainWindow):
+    # Emitted from the live solve thread with the layout, the solved model and the solver result
+    live_result_ready = pyqtSignal(int, object, object)
+
     def __init__(self):
         super().__init__()
 
-        self.insertedColumns = 0
         # Main window setup
         self.setWindowTitle("Optimization Solver")
         self.setGeometry(200, 200, 1000, 600)
@@ -24,10 +27,10 @@ class OptimizationApp(QMainWindow):
 
         # Add a background image
         self.background_label = QLabel(self.central_widget)
-        background_image = QPixmap("./image.jpg")  # Replace with the path to your image
-        self.background_label.setPixmap(background_image.scaled(300, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))  # Adjust size as needed
         self.background_label.setAlignment(Qt.AlignCenter)
         self.background_label.setGeometry(250, -60, 500, 300) 
+        # Decode the image once the event loop runs so the window shows up first
+        QTimer.singleShot(0, self.load_background_image)
         self.setStyleSheet("""
             QMainWindow { background-color: white; }
             QPushButton { background-color: #0078d7; color: white; font-size: 10pt; border-radius: 5px; }
@@ -87,6 +90,20 @@ class OptimizationApp(QMainWindow):
         self.pp_layout = None
         self.kp_layout = None
 
+        # Live mode state, per layout: kept-alive models, pending changes and invalid cells
+        self.live_models = {}
+        self.live_changes = {1: {}, 2: {}}
+        self.live_errors = {1: {}, 2: {}}
+        # Model being solved in the background for each layout, if any
+        self.live_solving = {1: None, 2: None}
+        self.live_timers = {}
+        self.live_executor = None
+        self.live_result_ready.connect(self.on_live_result)
+
+    def load_background_image(self):
+        background_image = QPixmap("./image.jpg")  # Replace with the path to your image
+        self.background_label.setPixmap(background_image.scaled(300, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))  # Adjust size as needed
+
     def go_back_to_selection(self):
         self.clear_current_layout()
         self.header_label.show()
@@ -137,6 +154,7 @@ class OptimizationApp(QMainWindow):
             self.table_widget_pp.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
             self.table_widget_pp.setColumnCount(2)
             self.table_widget_pp.setHorizontalHeaderLabels(["Name", "Profit"])
+            self.table_widget_pp.itemChanged.connect(lambda item: self.on_live_cell_changed(1, item))
             self.pp_layout.addWidget(self.table_widget_pp)
 
 
@@ -158,9 +176,16 @@ class OptimizationApp(QMainWindow):
             self.solve_pp_btn.setProperty("class", "solve-button")
             self.solve_pp_btn.clicked.connect(self.solve_production_planning)
             self.pp_layout.addWidget(self.solve_pp_btn)
+            self.live_pp_checkbox = QCheckBox("Live Mode (re-solve on every edit)", self)
+            self.live_pp_checkbox.stateChanged.connect(lambda state: self.toggle_live_mode(1, state == Qt.Checked))
+            self.pp_layout.addWidget(self.live_pp_checkbox)
             self.pp_results_label = QTextEdit()
             self.pp_results_label.setReadOnly(True)
             self.pp_layout.addWidget(self.pp_results_label)
+            # "Available <constraint>" inputs live in their own layout, so adding or removing one
+            # never depends on where other widgets sit
+            self.max_inputs_layout_pp = QVBoxLayout()
+            self.pp_layout.addLayout(self.max_inputs_layout_pp)
             self.pp_layout.addWidget(self.back_button)
         self.add_item_row(layout=1)
         self.show_layout(self.pp_layout)
@@ -174,6 +199,7 @@ class OptimizationApp(QMainWindow):
             self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
             self.table_widget.setColumnCount(1)
             self.table_widget.setHorizontalHeaderLabels(["Value"])
+            self.table_widget.itemChanged.connect(lambda item: self.on_live_cell_changed(2, item))
             self.kp_layout.addWidget(self.table_widget)
 
             self.add_column_button = QPushButton("Add Constraint", self)
@@ -194,9 +220,14 @@ class OptimizationApp(QMainWindow):
             self.solve_kp_btn.setProperty("class", "solve-button")
             self.solve_kp_btn.clicked.connect(self.solve_knapsack)
             self.kp_layout.addWidget(self.solve_kp_btn)
+            self.live_kp_checkbox = QCheckBox("Live Mode (re-solve on every edit)", self)
+            self.live_kp_checkbox.stateChanged.connect(lambda state: self.toggle_live_mode(2, state == Qt.Checked))
+            self.kp_layout.addWidget(self.live_kp_checkbox)
             self.kp_results_label = QTextEdit()
             self.kp_results_label.setReadOnly(True)
             self.kp_layout.addWidget(self.kp_results_label)
+            self.max_inputs_layout = QVBoxLayout()
+            self.kp_layout.addLayout(self.max_inputs_layout)
             self.kp_layout.addWidget(self.back_button)
         self.add_item_row(layout=2)
         self.show_layout(self.kp_layout)
@@ -204,6 +235,10 @@ class OptimizationApp(QMainWindow):
     def show_layout(self, layout):
         if layout.parent() is not None:
             layout.parent().layout().removeItem(layout)
+        self.show_widgets(layout)
+        self.layout.addLayout(layout)
+
+    def show_widgets(self, layout):
         for i in range(layout.count()):
             item = layout.itemAt(i)
             widget = item.widget()
@@ -212,24 +247,27 @@ class OptimizationApp(QMainWindow):
             else:
                 sub_layout = item.layout()
                 if sub_layout:
-                    self.show_layout(sub_layout)
-        self.layout.addLayout(layout)
+                    self.show_widgets(sub_layout)
 
     def add_new_column(self, layout):
-        self.insertedColumns += 1
         if layout == 2:
-            use_layout = self.kp_layout
+            use_layout = self.max_inputs_layout
             table = self.table_widget
             max_values = self.max_value_inputs
             constraints = self.constraints_kp
         else:
-            use_layout = self.pp_layout
+            use_layout = self.max_inputs_layout_pp
             table = self.table_widget_pp
             max_values = self.max_value_inputs_pp
             constraints = self.constraints_pp
 
         column_name, ok = QInputDialog.getText(self, "New Constraint", "Enter constraint name:")
         if ok and column_name:
+            if column_name in constraints:
+                QMessageBox.warning(self, "Input Error", f"Constraint {column_name} already exists")
+                return
+            if layout in self.live_models:
+                self.live_changes[layout][('add_constraint', column_name)] = None
             current_column_count = table.columnCount()
             table.setColumnCount(current_column_count + 1)
             table.setHorizontalHeaderItem(current_column_count, QTableWidgetItem(column_name))
@@ -237,12 +275,15 @@ class OptimizationApp(QMainWindow):
                 table.setItem(row, current_column_count, QTableWidgetItem(""))
             label = QLabel(f"Available {column_name}", self)
             line_edit = QLineEdit(self)
-            print(len(use_layout) - 1)
-            use_layout.insertWidget(len(use_layout) - 1, label)
-            print(len(use_layout) - 1)
-            use_layout.insertWidget(len(use_layout) - 1, line_edit)
-            constraints[column_name] = (len(use_layout) - 1, self.insertedColumns)
+            line_edit.textChanged.connect(lambda text: self.on_live_max_changed(layout, column_name, text))
+            use_layout.addWidget(label)
+            use_layout.addWidget(line_edit)
+            constraints[column_name] = label
             max_values[column_name] = line_edit
+            if layout in self.live_models:
+                for row in range(table.rowCount()):
+                    self.record_live_edit(layout, ('coefficient', row, column_name), "")
+                self.record_live_edit(layout, ('max', column_name), "")
 
     def remove_constraint_popup(self, layout):
         if layout == 2:
@@ -278,42 +319,51 @@ class OptimizationApp(QMainWindow):
 
     def remove_constraint(self, layout, column_name):
         if layout == 2:
-            use_layout = self.kp_layout
+            use_layout = self.max_inputs_layout
             table = self.table_widget
             max_values = self.max_value_inputs
             constraints = self.constraints_kp
-            offset = 0
         else:
-            use_layout = self.pp_layout
+            use_layout = self.max_inputs_layout_pp
             table = self.table_widget_pp
             max_values = self.max_value_inputs_pp
             constraints = self.constraints_pp
-            offset = 1
 
-        print(column_name, constraints[column_name])
-        toRemove1 = use_layout.itemAt(constraints[column_name][0]-1+offset)
-        toRemove2 = use_layout.itemAt(constraints[column_name][0]-2+offset)
+        if column_name not in constraints:
+            return
+        table.removeColumn(self.constraint_column(table, column_name))
+        for widget in (constraints.pop(column_name), max_values.pop(column_name)):
+            use_layout.removeWidget(widget)
+            widget.deleteLater()
 
-        table.removeColumn(constraints[column_name][1+offset])
-        use_layout.removeWidget(toRemove1.widget())
-        use_layout.removeWidget(toRemove2.widget())
-
-        constraints.pop(column_name)
-        max_values.pop(column_name)
+        if layout in self.live_models:
+            self.remove_live_constraint(layout, column_name)
 
     def add_item_row(self, layout):
         if layout == 2:
-            num_rows = self.table_widget.rowCount()
-            self.table_widget.insertRow(num_rows)
-            item = QTableWidgetItem("")
-            self.table_widget.setItem(num_rows, 0, item)
+            table = self.table_widget
         else:
-            num_rows = self.table_widget_pp.rowCount()
-            self.table_widget_pp.insertRow(num_rows)
-            item = QTableWidgetItem("")
-            self.table_widget_pp.setItem(num_rows, 0, item)
+            table = self.table_widget_pp
+        num_rows = table.rowCount()
+        if layout in self.live_models:
+            self.live_changes[layout][('add_item', num_rows)] = None
+        table.insertRow(num_rows)
+        item = QTableWidgetItem("")
+        table.setItem(num_rows, 0, item)
+        if layout in self.live_models:
+            for col in range(table.columnCount()):
+                self.record_live_edit(layout, self.live_cell_key(layout, num_rows, col), "")
+
+    def constraint_column(self, table, column_name):
+        for col in range(table.columnCount()):
+            if table.horizontalHeaderItem(col).text() == column_name:
+                return col
+        return -1
 
     def solve_knapsack(self):
+        # The solver, and gurobipy behind it, is only loaded on the first solve
+        from optimization_solver import solve_knapsack
+
         try:
             item_count = self.table_widget.rowCount()
             values = [self.table_widget.item(row, 0) for row in range(item_count)]
@@ -351,17 +401,22 @@ class OptimizationApp(QMainWindow):
                     'max': max_value
                 }
             result = solve_knapsack(values, constraint_values)
-            if result:
-                selected_items, total_value, time = result
-                selected_items_text = ', '.join([f"Item {index + 1}" for index in selected_items])
-                result_text = f"Selected items: {selected_items_text}\nTotal value: {total_value}\nTime taken: {time} seconds."
-                self.kp_results_label.setText(result_text)
-            else:
-                self.kp_results_label.setText("No solution found.")
+            self.show_knapsack_result(result)
         except ValueError as e:
             QMessageBox.warning(self, "Input Error", str(e))
 
+    def show_knapsack_result(self, result):
+        if result:
+            selected_items, total_value, time = result
+            selected_items_text = ', '.join([f"Item {index + 1}" for index in selected_items])
+            result_text = f"Selected items: {selected_items_text}\nTotal value: {total_value}\nTime taken: {time} seconds."
+            self.kp_results_label.setText(result_text)
+        else:
+            self.kp_results_label.setText("No solution found.")
+
     def solve_production_planning(self):
+        from optimization_solver import solve_production
+
         try:
             item_count = self.table_widget_pp.rowCount()
             values = [self.table_widget_pp.item(row, 1) for row in range(item_count)]
@@ -415,17 +470,215 @@ class OptimizationApp(QMainWindow):
                 }
 
             result = solve_production(products, constraints)
-            if result:
-                production_levels = result['Production Levels']
-                total_profit = result['Total Profit']
-                result_text = "Production Levels:\n" + "\n".join([f"{product}: {level}" for product, level in production_levels.items()])
-                result_text += f"\nTotal Profit: {total_profit}"
-                self.pp_results_label.setText(result_text)
-            else:
-                self.pp_results_label.setText("No solution found.")
+            self.show_production_result(result)
         except ValueError as e:
             QMessageBox.warning(self, "Input Error", str(e))
 
+    def show_production_result(self, result):
+        if result:
+            production_levels = result['Production Levels']
+            total_profit = result['Total Profit']
+            result_text = "Production Levels:\n" + "\n".join([f"{product}: {level}" for product, level in production_levels.items()])
+            result_text += f"\nTotal Profit: {total_profit}"
+            self.pp_results_label.setText(result_text)
+        else:
+            self.pp_results_label.setText("No solution found.")
+
+    def toggle_live_mode(self, layout, enabled):
+        if enabled:
+            self.start_live_mode(layout)
+        else:
+            self.stop_live_mode(layout)
+
+    def start_live_mode(self, layout):
+        from optimization_solver import LiveModel
+
+        if layout == 2:
+            table = self.table_widget
+            max_values = self.max_value_inputs
+        else:
+            table = self.table_widget_pp
+            max_values = self.max_value_inputs_pp
+
+        if layout not in self.live_timers:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(LIVE_DEBOUNCE_MS)
+            timer.timeout.connect(lambda: self.flush_live_changes(layout))
+            self.live_timers[layout] = timer
+        self.live_models[layout] = LiveModel('knapsack' if layout == 2 else 'production')
+        self.live_changes[layout] = {}
+        self.live_errors[layout] = {}
+
+        # The table is read once; from then on only the edited cells are applied
+        for row in range(table.rowCount()):
+            self.live_changes[layout][('add_item', row)] = None
+        for column_name in max_values:
+            self.live_changes[layout][('add_constraint', column_name)] = None
+        for row in range(table.rowCount()):
+            for col in range(table.columnCount()):
+                item = table.item(row, col)
+                self.record_live_edit(layout, self.live_cell_key(layout, row, col), item.text() if item else "")
+        for column_name, max_value_input in max_values.items():
+            self.record_live_edit(layout, ('max', column_name), max_value_input.text())
+
+    def stop_live_mode(self, layout):
+        model = self.live_models.pop(layout, None)
+        # A model still being solved is disposed of when its result comes back
+        if model is not None and self.live_solving[layout] is not model:
+            model.dispose()
+        if layout in self.live_timers:
+            self.live_timers[layout].stop()
+        for key in list(self.live_errors[layout]):
+            self.mark_live_cell(layout, key, None)
+        self.live_changes[layout] = {}
+        self.live_errors[layout] = {}
+
+    def live_cell_key(self, layout, row, col):
+        if layout == 2:
+            table = self.table_widget
+            first_constraint = 1
+        else:
+            table = self.table_widget_pp
+            first_constraint = 2
+        if col >= first_constraint:
+            return ('coefficient', row, table.horizontalHeaderItem(col).text())
+        if col == first_constraint - 1:
+            return ('value', row)
+        return ('name', row)
+
+    def validate_live_cell(self, key, text):
+        """
+        Validates one edited cell with the same rules as the Solve buttons.
+
+        Returns:
+            A tuple (value, error) where exactly one of them is None.
+        """
+        if key[0] == 'name':
+            if text == "":
+                return None, "Items must have a non empty name"
+            return text, None
+        if not text.isdigit():
+            if key[0] == 'value':
+                return None, "Item values must be numbers"
+            if key[0] == 'max':
+                return None, f"Max value for constraint {key[1]} must be a number"
+            return None, f"{key[2]} for all items must be a number"
+        value = float(text)
+        if value <= 0 and key[0] == 'value':
+            return None, "Items must have strictly positive values"
+        if value <= 0 and key[0] == 'max':
+            return None, f"Max value {key[1]} must be a strictly positive number"
+        return value, None
+
+    def mark_live_cell(self, layout, key, error):
+        if key[0] == 'max':
+            max_values = self.max_value_inputs if layout == 2 else self.max_value_inputs_pp
+            if key[1] in max_values:
+                max_values[key[1]].setStyleSheet("background-color: #f8d7da;" if error else "")
+            return
+
+        table = self.table_widget if layout == 2 else self.table_widget_pp
+        if key[0] == 'coefficient':
+            col = self.constraint_column(table, key[2])
+        else:
+            col = 1 if layout == 1 and key[0] == 'value' else 0
+        item = table.item(key[1], col)
+        if item is None:
+            return
+        # Coloring a cell emits itemChanged, which must not be recorded as an edit
+        table.blockSignals(True)
+        item.setBackground(QColor("#f8d7da") if error else QBrush())
+        table.blockSignals(False)
+
+    def record_live_edit(self, layout, key, text):
+        value, error = self.validate_live_cell(key, text)
+        if error:
+            self.live_errors[layout][key] = error
+        else:
+            self.live_errors[layout].pop(key, None)
+            self.live_changes[layout][key] = value
+        self.mark_live_cell(layout, key, error)
+        self.live_timers[layout].start()
+
+    def remove_live_constraint(self, layout, column_name):
+        def refers_to_constraint(key):
+            if key[0] == 'coefficient':
+                return key[2] == column_name
+            return key[0] in ('add_constraint', 'max') and key[1] == column_name
+
+        changes = self.live_changes[layout]
+        pending_add = ('add_constraint', column_name) in changes
+        for key in [key for key in changes if refers_to_constraint(key)]:
+            changes.pop(key)
+        for key in [key for key in self.live_errors[layout] if refers_to_constraint(key)]:
+            self.live_errors[layout].pop(key)
+        if not pending_add:
+            changes[('remove_constraint', column_name)] = None
+        self.live_timers[layout].start()
+
+    def on_live_cell_changed(self, layout, item):
+        if layout not in self.live_models:
+            return
+        self.record_live_edit(layout, self.live_cell_key(layout, item.row(), item.column()), item.text())
+
+    def on_live_max_changed(self, layout, column_name, text):
+        if layout not in self.live_models:
+            return
+        self.record_live_edit(layout, ('max', column_name), text)
+
+    def flush_live_changes(self, layout):
+        # Edits made during a solve are applied once it finishes
+        model = self.live_models.get(layout)
+        if model is None or self.live_solving[layout] is model:
+            return
+        for key, value in self.live_changes[layout].items():
+            if key[0] == 'add_item':
+                model.add_item()
+            elif key[0] == 'add_constraint':
+                model.add_constraint(key[1])
+            elif key[0] == 'remove_constraint':
+                model.remove_constraint(key[1])
+            elif key[0] == 'name':
+                model.set_name(key[1], value)
+            elif key[0] == 'value':
+                model.set_value(key[1], value)
+            elif key[0] == 'coefficient':
+                model.set_coefficient(key[1], key[2], value)
+            else:
+                model.set_max(key[1], value)
+        self.live_changes[layout] = {}
+
+        results_label = self.kp_results_label if layout == 2 else self.pp_results_label
+        errors = self.live_errors[layout]
+        if errors:
+            results_label.setText(f"Waiting for {len(errors)} cell(s) to be filled in correctly.\n{next(iter(errors.values()))}")
+            return
+
+        if self.live_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.live_executor = ThreadPoolExecutor(max_workers=1)
+        self.live_solving[layout] = model
+        future = self.live_executor.submit(model.solve)
+        future.add_done_callback(lambda f: self.live_result_ready.emit(layout, model, f.exception() or f.result()))
+
+    def on_live_result(self, layout, model, result):
+        if self.live_solving[layout] is model:
+            self.live_solving[layout] = None
+        # Drop results of a model replaced or stopped while it was being solved
+        if model is not self.live_models.get(layout):
+            model.dispose()
+            return
+        if isinstance(result, Exception):
+            results_label = self.kp_results_label if layout == 2 else self.pp_results_label
+            results_label.setText(f"Solver error: {result}")
+        elif layout == 2:
+            self.show_knapsack_result(result)
+        else:
+            self.show_production_result(result)
+        if self.live_changes[layout] or self.live_errors[layout]:
+            self.live_timers[layout].start()
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     ex = OptimizationApp()
@@ -0,0 +1,257 @@
+import sys
+
+# numpy and the solvers are imported where they are used, like in optimization_solver.
+
+KNAPSACK_KINDS = [
+    "uncorrelated",
+    "weakly_correlated",
+    "strongly_correlated",
+    "inverse_strongly_correlated",
+    "subset_sum",
+    "multi_constraint",
+]
+
+# Instances stored by build_corpus when no specification is given:
+# (name, problem, generator keyword arguments). Multi-constraint instances are kept small,
+# as proving their optimum takes much longer than for the other classes.
+DEFAULT_CORPUS = (
+    [(f"knapsack_{kind}_{n}", "knapsack", {"kind": kind, "n_items": n, "seed": n})
+     for kind in KNAPSACK_KINDS if kind != "multi_constraint" for n in (100, 1000)]
+    + [(f"knapsack_multi_constraint_{n}_{k}", "knapsack",
+        {"kind": "multi_constraint", "n_items": n, "n_constraints": k, "seed": n + k})
+       for n, k in ((50, 5), (100, 5))]
+    + [(f"production_{n}_{k}", "production",
+        {"n_products": n, "n_constraints": k, "density": 0.2, "seed": n + k})
+       for n, k in ((100, 20), (1000, 100), (5000, 500))]
+)
+
+
+def generate_knapsack(kind, n_items, n_constraints=1, coefficient_range=1000, capacity_ratio=0.5, seed=0):
+    """
+    Generates a knapsack instance of one of the classical hard classes.
+
+    Parameters:
+        - kind (str): One of KNAPSACK_KINDS.
+        - n_items (int): Number of items.
+        - n_constraints (int): Number of constraints, only used by 'multi_constraint'.
+        - coefficient_range (int): Weights, and values, are drawn in [1, coefficient_range].
+        - capacity_ratio (float): Each 'max' is this fraction of the total weight of the items.
+        - seed (int): Seed of the generator, the same seed always gives the same instance.
+
+    Returns:
+        - A tuple (values, constraint_values) in the format taken by solve_knapsack.
+    """
+    import numpy as np
+
+    if kind not in KNAPSACK_KINDS:
+        raise ValueError(f"Unknown knapsack kind: {kind}")
+
+    rng = np.random.default_rng(seed)
+    r = coefficient_range
+    if kind != "multi_constraint":
+        n_constraints = 1
+    weights = rng.integers(1, r + 1, size=(n_constraints, n_items))
+    w = weights[0]
+
+    if kind == "uncorrelated":
+        values = rng.integers(1, r + 1, size=n_items)
+    elif kind == "weakly_correlated":
+        values = np.maximum(w + rng.integers(-(r // 10), r // 10 + 1, size=n_items), 1)
+    elif kind == "strongly_correlated":
+        values = w + r // 10
+    elif kind == "inverse_strongly_correlated":
+        values = rng.integers(1, r + 1, size=n_items)
+        weights = (values + r // 10)[None, :]
+    elif kind == "subset_sum":
+        values = w.copy()
+    else:
+        # Values correlated with the average weight, as in the Chu and Beasley instances
+        values = weights.mean(axis=0).astype(np.int64) + rng.integers(0, r // 2 + 1, size=n_items)
+
+    capacities = np.floor(capacity_ratio * weights.sum(axis=1)).astype(np.int64)
+    constraint_values = {
+        f"constraint_{k}": {"values": weights[k].tolist(), "max": int(capacities[k])}
+        for k in range(weights.shape[0])
+    }
+    return values.tolist(), constraint_values
+
+
+def generate_production(n_products, n_constraints, density=0.2, capacity_ratio=0.3, seed=0):
+    """
+    Generates a production planning LP with a sparse resource consumption matrix.
+
+    Parameters:
+        - n_products (int): Number of products.
+        - n_constraints (int): Number of resource constraints.
+        - density (float): Fraction of non-zero resource consumptions.
+        - capacity_ratio (float): Each 'max' is this fraction of the resource needed to make one unit of every product.
+        - seed (int): Seed of the generator, the same seed always gives the same instance.
+
+    Returns:
+        - A tuple (products, constraints) in the format taken by solve_production.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    mask = rng.random((n_constraints, n_products)) < density
+    # Every product consumes at least one resource, otherwise the LP is unbounded
+    mask[rng.integers(0, n_constraints, size=n_products), np.arange(n_products)] = True
+    coefficients = np.where(mask, rng.integers(1, 100, size=mask.shape), 0)
+
+    # Profits loosely follow resource use so that no product trivially dominates
+    profits = coefficients.sum(axis=0) * rng.uniform(0.5, 1.5, size=n_products)
+    limits = capacity_ratio * coefficients.sum(axis=1)
+
+    products = [{"name": f"Product {i}", "profit": float(profits[i])} for i in range(n_products)]
+    constraints = {
+        f"resource_{k}": {"values": coefficients[k].tolist(), "max": float(limits[k])}
+        for k in range(n_constraints)
+    }
+    return products, constraints
+
+
+def knapsack_dp(values, weights, capacity):
+    """
+    Solves a single-constraint knapsack exactly by dynamic programming over the capacity.
+
+    Returns:
+        - The optimal total value.
+    """
+    import numpy as np
+
+    best = np.zeros(int(capacity) + 1, dtype=np.int64)
+    for value, weight in zip(values, weights):
+        weight = int(weight)
+        if weight <= capacity:
+            best[weight:] = np.maximum(best[weight:], best[:-weight] + value)
+    return int(best[-1])
+
+
+def knapsack_optimum(values, constraint_values, time_limit=600):
+    """
+    Computes and checks the optimum of a knapsack instance.
+
+    Single-constraint instances are solved by dynamic programming, independently of Gurobi.
+    Other instances are solved to a zero gap with solve_knapsack, within `time_limit` seconds,
+    and the selection is checked against every constraint.
+
+    Returns:
+        - The optimal total value.
+    """
+    if len(constraint_values) == 1:
+        (constraint_data,) = constraint_values.values()
+        return knapsack_dp(values, constraint_data["values"], constraint_data["max"])
+
+    from optimization_solver import solve_knapsack
+
+    result = solve_knapsack(values, constraint_values, mip_gap=0, time_limit=time_limit)
+    if result is None:
+        raise ValueError(f"Optimum not proven within {time_limit} s, use a smaller instance or a larger time_limit")
+    selected_items, total_value, _ = result
+    for constraint_type, constraint_data in constraint_values.items():
+        if sum(constraint_data["values"][i] for i in selected_items) > constraint_data["max"]:
+            raise ValueError(f"Optimal selection violates constraint {constraint_type}")
+    if sum(values[i] for i in selected_items) != round(total_value):
+        raise ValueError("Optimal value does not match the selected items")
+    return int(round(total_value))
+
+
+def production_optimum(products, constraints, tol=1e-6):
+    """
+    Computes and checks the optimum of a production planning instance with solve_production.
+
+    Returns:
+        - The optimal total profit.
+    """
+    from optimization_solver import solve_production
+
+    result = solve_production(products, constraints)
+    if result is None:
+        raise ValueError("No optimal solution found")
+    levels = [result["Production Levels"][p["name"]] for p in products]
+    for constraint_name, constraint_data in constraints.items():
+        used = sum(c * level for c, level in zip(constraint_data["values"], levels))
+        if used > constraint_data["max"] * (1 + tol) + tol:
+            raise ValueError(f"Optimal production violates constraint {constraint_name}")
+    profit = sum(p["profit"] * level for p, level in zip(products, levels))
+    if abs(profit - result["Total Profit"]) > tol * max(abs(profit), 1.0):
+        raise ValueError("Optimal profit does not match the production levels")
+    return result["Total Profit"]
+
+
+def build_corpus(path, specs=DEFAULT_CORPUS, time_limit=600):
+    """
+    Generates the instances described by `specs`, verifies their optima and stores them
+    in a compressed .npz file. Each knapsack optimum must be proven within `time_limit` seconds.
+
+    Each instance is stored under its name as arrays:
+        - knapsack: '<name>/values', '<name>/weights' (constraints x items), '<name>/capacities', '<name>/optimum'.
+        - production: '<name>/profits', '<name>/coefficients' (constraints x products), '<name>/limits', '<name>/optimum'.
+    """
+    import numpy as np
+
+    arrays = {}
+    for name, problem, kwargs in specs:
+        if problem == "knapsack":
+            values, constraint_values = generate_knapsack(**kwargs)
+            arrays[f"{name}/values"] = np.array(values, dtype=np.int64)
+            arrays[f"{name}/weights"] = np.array([c["values"] for c in constraint_values.values()], dtype=np.int64)
+            arrays[f"{name}/capacities"] = np.array([c["max"] for c in constraint_values.values()], dtype=np.int64)
+            arrays[f"{name}/optimum"] = np.array(knapsack_optimum(values, constraint_values, time_limit))
+        elif problem == "production":
+            products, constraints = generate_production(**kwargs)
+            arrays[f"{name}/profits"] = np.array([p["profit"] for p in products])
+            arrays[f"{name}/coefficients"] = np.array([c["values"] for c in constraints.values()], dtype=np.int64)
+            arrays[f"{name}/limits"] = np.array([c["max"] for c in constraints.values()])
+            arrays[f"{name}/optimum"] = np.array(production_optimum(products, constraints))
+        else:
+            raise ValueError(f"Unknown problem: {problem}")
+    np.savez_compressed(path, **arrays)
+
+
+def load_corpus(path):
+    """
+    Loads a corpus written by build_corpus.
+
+    Returns:
+        - A dictionary mapping each instance name to a dictionary with the 'problem' ('knapsack' or
+          'production'), the instance in the format taken by the solver ('values' and 'constraint_values',
+          or 'products' and 'constraints') and its verified 'optimum'.
+    """
+    import numpy as np
+
+    instances = {}
+    with np.load(path) as corpus:
+        names = sorted({key.rsplit("/", 1)[0] for key in corpus.files})
+        for name in names:
+            optimum = corpus[f"{name}/optimum"].item()
+            if f"{name}/values" in corpus.files:
+                weights = corpus[f"{name}/weights"]
+                capacities = corpus[f"{name}/capacities"]
+                instances[name] = {
+                    "problem": "knapsack",
+                    "values": corpus[f"{name}/values"].tolist(),
+                    "constraint_values": {
+                        f"constraint_{k}": {"values": weights[k].tolist(), "max": int(capacities[k])}
+                        for k in range(len(capacities))
+                    },
+                    "optimum": optimum,
+                }
+            else:
+                profits = corpus[f"{name}/profits"]
+                coefficients = corpus[f"{name}/coefficients"]
+                limits = corpus[f"{name}/limits"]
+                instances[name] = {
+                    "problem": "production",
+                    "products": [{"name": f"Product {i}", "profit": float(profits[i])} for i in range(len(profits))],
+                    "constraints": {
+                        f"resource_{k}": {"values": coefficients[k].tolist(), "max": float(limits[k])}
+                        for k in range(len(limits))
+                    },
+                    "optimum": optimum,
+                }
+    return instances
+
+
+if __name__ == '__main__':
+    build_corpus(sys.argv[1] if len(sys.argv) > 1 else "corpus.npz")
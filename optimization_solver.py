@@ -1,8 +1,10 @@
-from gurobipy import Model, GRB
+import os
 
-from gurobipy import *
+# gurobipy, numpy and the thread pool are imported where they are used, so that importing this
+# module stays cheap for the GUI, the workers and the command line.
 
-def solve_knapsack(values, constraint_values):
+
+def solve_knapsack(values, constraint_values, mip_gap=None, time_limit=None):
     """
     This function solves a knapsack problem to maximize the total value of items,
     considering multiple constraint limits.
@@ -13,15 +15,24 @@ def solve_knapsack(values, constraint_values):
                            and each value is a dictionary with 'values' representing
                            the constraint values for each item and 'max' representing
                            the maximum limit for that constraint.
+        mip_gap: An optional relative optimality gap; Gurobi's default is used if omitted.
+        time_limit: An optional limit on the solve time (in seconds); no solution is returned if it is reached.
 
     Returns:
         A tuple containing:
             - A list of indices representing the selected items to put in the knapsack.
             - The total value of the selected items.
             - The time taken by Gurobi to solve the model (in seconds).
+        or None if no optimal solution was found (for example when the time limit is reached).
     """
+    from gurobipy import Model, GRB
+
     # Create a Gurobi model instance named "knapsack"
     m = Model("knapsack")
+    if mip_gap is not None:
+        m.Params.MIPGap = mip_gap
+    if time_limit is not None:
+        m.Params.TimeLimit = time_limit
 
     # Define the number of items based on the length of the values list
     item_count = len(values)
@@ -52,10 +63,227 @@ def solve_knapsack(values, constraint_values):
         # Return selected items, total value, and solution time
         return selected_items, m.objVal, m.Runtime
     else:
-        # If not optimal, return empty list and 0 for all values
-        return [], 0
+        # If not optimal, there is no selection to return
+        return None
+
+
+def _scenario_arrays(values, constraint_values, capacities, weights=None):
+    """
+    Converts the scenario inputs to NumPy arrays.
+
+    Returns:
+        A tuple (values, capacities, weights) with values of shape (items,), capacities of shape
+        (scenarios, constraints) and weights of shape (constraints, items) when the item weights are
+        certain, or (scenarios, constraints, items) when they vary with the scenario.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=float)
+    capacities = np.asarray(capacities, dtype=float)
+    if capacities.ndim == 1:
+        # A single uncertain constraint
+        capacities = capacities[:, None]
+    if weights is None:
+        weights = np.array([data['values'] for data in constraint_values.values()], dtype=float)
+    else:
+        weights = np.asarray(weights, dtype=float)
+
+    if capacities.shape[1] != len(constraint_values):
+        raise ValueError("Scenario capacities must have one column per constraint")
+    if weights.shape[-2:] != (len(constraint_values), len(values)):
+        raise ValueError("Scenario weights must have one row per constraint and one column per item")
+    if weights.ndim == 3 and weights.shape[0] != capacities.shape[0]:
+        raise ValueError("Scenario weights and capacities must have the same number of scenarios")
+    return values, capacities, weights
+
+
+def evaluate_knapsack_selections(selections, values, constraint_values, capacities, weights=None):
+    """
+    Evaluates candidate knapsack selections across all scenarios at once.
+
+    Args:
+        selections: An array of shape (candidates, items) with 1 for each selected item.
+        values: A list representing the value of each item.
+        constraint_values: Same format as for solve_knapsack.
+        capacities: An array of shape (scenarios, constraints) with the 'max' of each constraint,
+                    in the order of constraint_values, for every scenario.
+        weights: An optional array of shape (scenarios, constraints, items) with the constraint
+                 values of each item for every scenario. The nominal 'values' are used if omitted.
+
+    Returns:
+        A dictionary of arrays of shape (candidates,):
+            - 'Value': The total value of each selection.
+            - 'Feasibility': The fraction of scenarios in which the selection satisfies every constraint.
+            - 'Expected Overflow': The average total excess over the capacities.
+    """
+    import numpy as np
+
+    values, capacities, weights = _scenario_arrays(values, constraint_values, capacities, weights)
+    selections = np.atleast_2d(np.asarray(selections, dtype=float))
+
+    if weights.ndim == 2:
+        # Certain weights: the load of a selection is the same in every scenario
+        loads = (selections @ weights.T)[:, None, :]
+    else:
+        loads = np.einsum('cn,skn->csk', selections, weights)
+    overflow = np.maximum(loads - capacities[None, :, :], 0.0)
+
+    return {
+        'Value': selections @ values,
+        'Feasibility': (overflow.max(axis=2) <= 1e-9).mean(axis=1),
+        'Expected Overflow': overflow.sum(axis=2).mean(axis=1),
+    }
+
+
+def _solve_scenario_model(values, capacities, weights, mode, alpha, penalty, start=None):
+    """
+    Solves the sample-average or chance-constrained knapsack on a sample of scenarios.
 
-from gurobipy import *
+    Returns:
+        A tuple (selection, objective value, runtime), with selection None if no optimal solution was found.
+    """
+    import numpy as np
+    from gurobipy import Model, GRB, quicksum
+
+    m = Model("scenario knapsack")
+    m.Params.OutputFlag = 0
+
+    item_count = len(values)
+    scenario_count, constraint_count = capacities.shape
+    x = m.addVars(item_count, vtype=GRB.BINARY, name="x")
+    if start is not None:
+        # Warm start from the selection found on the previous, smaller sample
+        for i in range(item_count):
+            x[i].Start = start[i]
+    value_expr = quicksum(values[i] * x[i] for i in range(item_count))
+
+    def load(w):
+        return quicksum(w[i] * x[i] for i in range(item_count) if w[i])
+
+    # With certain weights every scenario shares the same load expressions
+    nominal_loads = [load(weights[k]) for k in range(constraint_count)] if weights.ndim == 2 else None
+
+    if mode == 'chance':
+        # z[s] = 1 lets scenario s be violated, for at most a fraction alpha of the scenarios
+        z = m.addVars(scenario_count, vtype=GRB.BINARY, name="z")
+        for s in range(scenario_count):
+            for k in range(constraint_count):
+                w = weights[k] if weights.ndim == 2 else weights[s, k]
+                big_m = max(w.sum() - capacities[s, k], 0.0)
+                expr = nominal_loads[k] if nominal_loads else load(w)
+                m.addConstr(expr <= capacities[s, k] + big_m * z[s], f"Constraint_{s}_{k}")
+        m.addConstr(z.sum() <= np.floor(alpha * scenario_count), "Violations")
+        m.setObjective(value_expr, GRB.MAXIMIZE)
+    else:
+        # o[s, k] is the overflow of constraint k in scenario s, charged at `penalty` per unit on average
+        o = m.addVars(scenario_count, constraint_count, lb=0.0, name="o")
+        for s in range(scenario_count):
+            for k in range(constraint_count):
+                w = weights[k] if weights.ndim == 2 else weights[s, k]
+                expr = nominal_loads[k] if nominal_loads else load(w)
+                m.addConstr(expr - o[s, k] <= capacities[s, k], f"Constraint_{s}_{k}")
+        m.setObjective(value_expr - penalty / scenario_count * o.sum(), GRB.MAXIMIZE)
+
+    m.optimize()
+
+    if m.status == GRB.OPTIMAL:
+        selection = np.array([1.0 if x[i].X > 0.5 else 0.0 for i in range(item_count)])
+        return selection, m.objVal, m.Runtime
+    else:
+        return None, 0, m.Runtime
+
+
+def solve_knapsack_scenarios(values, constraint_values, capacities, weights=None, mode='saa', alpha=0.05,
+                             penalty=None, initial_scenarios=50, tol=1e-2, seed=0):
+    """
+    This function solves a knapsack problem whose constraint limits, and optionally item constraint
+    values, are uncertain and given as scenarios, and returns one selection that is robust across them.
+
+    The model is first solved on a small random sample of the scenarios. The selection is then
+    validated on all scenarios with vectorized NumPy, and the sample is doubled until the
+    validation agrees with the model.
+
+    Args:
+        values: A list representing the value of each item.
+        constraint_values: Same format as for solve_knapsack. The 'max' entries are replaced by the scenarios.
+        capacities: An array of shape (scenarios, constraints) with the 'max' of each constraint,
+                    in the order of constraint_values, for every scenario.
+        weights: An optional array of shape (scenarios, constraints, items) with the constraint
+                 values of each item for every scenario. The nominal 'values' are used if omitted.
+        mode: 'saa' to maximize the value minus the penalized average overflow (sample average
+              approximation), or 'chance' to maximize the value while satisfying every constraint
+              in at least a fraction 1 - alpha of the scenarios.
+        alpha: Fraction of scenarios that may be violated in 'chance' mode.
+        penalty: Cost of one unit of average overflow in 'saa' mode (defaults to the sum of the values).
+        initial_scenarios: Number of scenarios in the first sample.
+        tol: Relative gap between the sample objective and its validation below which the loop stops.
+        seed: Seed of the scenario sampling.
+
+    Returns:
+        A dictionary containing:
+            - 'Selected Items': A list of indices representing the selected items.
+            - 'Total Value': The total value of the selected items.
+            - 'Feasibility': The fraction of all scenarios in which the selection fits.
+            - 'Expected Overflow': The average total excess over the capacities across all scenarios.
+            - 'Scenarios Used': The number of scenarios in the last solved sample.
+            - 'Runtime': The total time taken by Gurobi over all samples (in seconds).
+        or None if no selection was found.
+    """
+    import numpy as np
+
+    if mode not in ('saa', 'chance'):
+        raise ValueError(f"Unknown scenario mode: {mode}")
+
+    values, capacities, weights = _scenario_arrays(values, constraint_values, capacities, weights)
+    if penalty is None:
+        penalty = values.sum()
+
+    scenario_count = capacities.shape[0]
+    order = np.random.default_rng(seed).permutation(scenario_count)
+    sample_size = min(initial_scenarios, scenario_count)
+
+    best = None
+    start = None
+    runtime = 0.0
+    while True:
+        sample = order[:sample_size]
+        sample_weights = weights if weights.ndim == 2 else weights[sample]
+        selection, objective, time = _solve_scenario_model(values, capacities[sample], sample_weights,
+                                                           mode, alpha, penalty, start)
+        runtime += time
+        if selection is None:
+            break
+
+        evaluation = evaluate_knapsack_selections(selection, values, constraint_values, capacities, weights)
+        value = evaluation['Value'][0]
+        feasibility = evaluation['Feasibility'][0]
+        overflow = evaluation['Expected Overflow'][0]
+        if mode == 'chance':
+            converged = feasibility >= 1 - alpha
+            score = value if converged else -np.inf
+        else:
+            score = value - penalty * overflow
+            converged = abs(objective - score) <= tol * max(abs(score), 1.0)
+
+        if best is None or score >= best['Score']:
+            best = {
+                'Score': score,
+                'Selected Items': [i for i in range(len(values)) if selection[i] > 0.5],
+                'Total Value': value,
+                'Feasibility': feasibility,
+                'Expected Overflow': overflow,
+                'Scenarios Used': sample_size,
+            }
+        if converged or sample_size == scenario_count:
+            break
+        sample_size = min(2 * sample_size, scenario_count)
+        start = selection
+
+    if best is None:
+        return None
+    best.pop('Score')
+    best['Runtime'] = runtime
+    return best
 
 
 def solve_production(products, constraints):
@@ -74,6 +302,7 @@ def solve_production(products, constraints):
     Returns:
         - A dictionary with production levels and the total profit, or None if infeasible.
     """
+    from gurobipy import Model, GRB, quicksum
 
     m = Model("Generic Production Planning")
 
@@ -107,21 +336,402 @@ def solve_production(products, constraints):
         return None
 
 
-products = [
-    {"name": "Product A", "profit": 10},
-    {"name": "Product B", "profit": 15},
-]
+def _build_production_model(products, constraints, env=None):
+    """
+    Builds the production planning LP used by the Pareto scans.
+
+    Returns:
+        A tuple (model, x, constrs, profit_expr) where x is the list of production variables
+        in product order and constrs maps each constraint name to its Gurobi constraint.
+    """
+    from gurobipy import Model, GRB, quicksum
+
+    m = Model("Generic Production Planning", env=env)
+    m.Params.OutputFlag = 0
+    # Parallelism comes from the scan itself, so each model stays single threaded
+    m.Params.Threads = 1
+
+    x = [m.addVar(vtype=GRB.CONTINUOUS, name=f"{p['name']}") for p in products]
+    profit_expr = quicksum(p['profit'] * x[i] for i, p in enumerate(products))
+    m.setObjective(profit_expr, GRB.MAXIMIZE)
+
+    constrs = {}
+    for constraint_name, constraint_data in constraints.items():
+        constraint_values = constraint_data['values']
+        constraint_expr = quicksum(constraint_values[i] * x[i] for i in range(len(products)))
+        constrs[constraint_name] = m.addConstr(constraint_expr <= constraint_data['max'], f"{constraint_name}")
+    m.update()
+    return m, x, constrs, profit_expr
+
+
+def _pareto_model(scan):
+    """
+    Returns the production model of the calling thread, building it on first use.
+
+    Gurobi environments must not be shared between threads, so every thread gets its own
+    environment and keeps its model alive for all the rounds of the scan.
+    """
+    if not hasattr(scan['local'], 'state'):
+        from gurobipy import Env
+
+        env = Env(empty=True)
+        env.setParam('OutputFlag', 0)
+        env.start()
+        m, x, constrs, profit_expr = _build_production_model(scan['products'], scan['constraints'], env)
+        scan['local'].state = {'env': env, 'model': m, 'x': x, 'constrs': constrs, 'profit': profit_expr}
+        scan['models'].append(scan['local'].state)
+    return scan['local'].state
+
+
+def _dispose_pareto_models(scan):
+    for state in scan['models']:
+        state['model'].dispose()
+        state['env'].dispose()
+    scan['models'].clear()
+
+
+def _solve_pareto_batch(scan, objective, method, params, basis=None):
+    """
+    Solves a batch of scan points on the kept-alive model of the calling thread.
+
+    The points are solved in the given order, so each solve is warm-started from the basis
+    of the previous one. The first solve is warm-started from `basis` when it is provided.
+
+    Returns:
+        A list with, for each parameter, a dictionary describing the front point
+        ('Parameter', 'Profit', 'Resource', 'Production Levels', 'Slope', 'Basis'),
+        or None if that scan point has no optimal solution.
+    """
+    from gurobipy import GRB
+
+    state = _pareto_model(scan)
+    m, x, profit_expr = state['model'], state['x'], state['profit']
+    row = state['constrs'][objective]
+    resource_expr = m.getRow(row)
+    capacity = scan['constraints'][objective]['max']
+    # Undo what a batch of the other method may have left on this model
+    if method == 'epsilon':
+        m.setObjective(profit_expr, GRB.MAXIMIZE)
+    else:
+        row.RHS = capacity
+    # Dual simplex restarts cleanly after a right-hand side change, primal after an objective change
+    m.Params.Method = 1 if method == 'epsilon' else 0
+
+    if basis is not None:
+        m.setAttr(GRB.Attr.VBasis, m.getVars(), basis[0])
+        m.setAttr(GRB.Attr.CBasis, m.getConstrs(), basis[1])
+
+    points = []
+    for t in params:
+        if method == 'epsilon':
+            t = min(t, capacity)
+            row.RHS = t
+        else:
+            m.setObjective(profit_expr - t * resource_expr, GRB.MAXIMIZE)
+        m.optimize()
+
+        if m.status != GRB.OPTIMAL:
+            points.append(None)
+            continue
+        # Marginal profit of one more unit of resource at this point of the front
+        slope = row.Pi if method == 'epsilon' else t
+        basis = (m.getAttr(GRB.Attr.VBasis, m.getVars()), m.getAttr(GRB.Attr.CBasis, m.getConstrs()))
+        if method == 'epsilon' and slope <= 1e-9:
+            # The cap does not limit profit here, so other optima may use less resource than this one:
+            # keep the profit and minimize the resource use so the point is not dominated
+            floor = m.addConstr(profit_expr >= m.objVal - 1e-9 * max(abs(m.objVal), 1.0), "profit_floor")
+            m.setObjective(resource_expr, GRB.MINIMIZE)
+            m.optimize()
+            optimal = m.status == GRB.OPTIMAL
+            levels = [v.X for v in x] if optimal else None
+            m.remove(floor)
+            m.setObjective(profit_expr, GRB.MAXIMIZE)
+            if not optimal:
+                points.append(None)
+                continue
+        else:
+            levels = [v.X for v in x]
+        points.append({
+            'Parameter': t,
+            'Profit': sum(p['profit'] * level for p, level in zip(scan['products'], levels)),
+            'Resource': sum(c * level for c, level in zip(scan['constraints'][objective]['values'], levels)),
+            'Production Levels': levels,
+            'Slope': slope,
+            'Basis': basis,
+        })
+    return points
+
+
+def _min_resource(scan, objective):
+    """
+    Returns the smallest feasible use of the `objective` resource, or None if infeasible.
+    """
+    from gurobipy import GRB
+
+    state = _pareto_model(scan)
+    m = state['model']
+    m.setObjective(m.getRow(state['constrs'][objective]), GRB.MINIMIZE)
+    m.optimize()
+    resource = m.objVal if m.status == GRB.OPTIMAL else None
+    m.setObjective(state['profit'], GRB.MAXIMIZE)
+    return resource
+
+
+def _solve_pareto_parallel(executor, workers, scan, objective, method, candidates):
+    """
+    Splits the (parameter, basis) candidates into contiguous chunks and solves one chunk per worker.
+    Each chunk is warm-started from the basis attached to its first candidate.
+    """
+    chunk_size = -(-len(candidates) // workers)
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+    futures = [
+        executor.submit(_solve_pareto_batch, scan, objective, method, [t for t, _ in chunk], chunk[0][1])
+        for chunk in chunks
+    ]
+    return [point for future in futures for point in future.result()]
+
+
+def solve_production_pareto(products, constraints, objective, method='epsilon', n_points=5,
+                            max_points=50, tol=1e-3, workers=None):
+    """
+    Computes the Pareto front between profit (maximized) and the use of one resource (minimized).
+
+    The front is first scanned on a coarse grid, then refined adaptively: new points are only
+    added between neighbours where the front bends, so flat stretches cost no extra solves.
+    Scan points are solved in parallel across `workers` threads, each with its own Gurobi environment
+    and a model kept alive for the whole scan, and every solve is warm-started from the basis of a
+    neighbouring point.
+
+    Parameters:
+        - products (list of dicts): Same format as for solve_production.
+        - constraints (dict): Same format as for solve_production.
+        - objective (str): Name of the constraint whose resource use is minimized.
+        - method (str): 'epsilon' to cap the resource use (epsilon-constraint) or 'weighted'
+                        to maximize profit - weight * resource use (weighted sum).
+        - n_points (int): Number of points of the initial epsilon grid, anchors included
+                          (at most max_points).
+        - max_points (int): Maximum number of points on the returned front.
+        - tol (float): Relative profit gap below which a segment of the front is considered flat.
+        - workers (int): Number of parallel workers (defaults to the number of CPUs).
+
+    Returns:
+        - A dictionary with the front sorted by increasing resource use, or None if infeasible:
+            - 'Products': Names of the products, in column order of 'Production Levels'.
+            - 'Parameter': Epsilon (resource cap) or weight used for each point.
+            - 'Profit': Total profit of each point.
+            - 'Resource': Resource use of each point.
+            - 'Production Levels': Array of shape (points, products).
+            - 'Solves': Number of scan points solved, not counting the lexicographic re-solves
+                        that remove dominated points.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+
+    import numpy as np
+
+    if objective not in constraints:
+        raise ValueError(f"Unknown objective constraint: {objective}")
+    if method not in ('epsilon', 'weighted'):
+        raise ValueError(f"Unknown Pareto method: {method}")
+
+    workers = workers or os.cpu_count() or 1
+    n_points = min(n_points, max_points)
+
+    # Models are kept alive per thread across the rounds of the scan and disposed of at the end
+    scan = {'local': threading.local(), 'models': [], 'products': products, 'constraints': constraints}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Anchors: maximum profit, and maximum profit at the smallest feasible resource use
+            low = _min_resource(scan, objective)
+            if low is None:
+                return None
+            anchors = _solve_pareto_batch(scan, objective, 'epsilon', [float('inf'), low])
+            if any(point is None for point in anchors):
+                return None
+            if method == 'weighted':
+                # Weights for which each anchor is optimal
+                anchors[0]['Parameter'] = 0.0
+                anchors[1]['Parameter'] = anchors[1]['Slope']
+            front = [anchors[1], anchors[0]]
+            solves = 3
+
+            scale = max(abs(front[1]['Profit'] - front[0]['Profit']), 1e-9)
+            span = front[1]['Resource'] - front[0]['Resource']
+            if span <= tol * max(abs(front[1]['Resource']), 1.0):
+                # A single point dominates the whole front
+                front = [anchors[0]]
+            elif method == 'epsilon' and n_points > 2:
+                grid = [low + span * k / (n_points - 1) for k in range(1, n_points - 1)]
+                candidates = [(eps, front[0 if eps - low < span / 2 else 1]['Basis']) for eps in grid]
+                new_points = _solve_pareto_parallel(executor, workers, scan, objective, method, candidates)
+                solves += len(candidates)
+                front = [front[0]] + [p for p in new_points if p is not None] + [front[1]]
+
+            # Pairs of neighbours (by resource use) already known to enclose a flat segment
+            closed = set()
+            while len(front) < max_points:
+                candidates = []
+                for left, right in zip(front, front[1:]):
+                    key = (left['Resource'], right['Resource'])
+                    if key in closed or right['Resource'] - left['Resource'] <= tol * span:
+                        continue
+                    chord = (right['Profit'] - left['Profit']) / (right['Resource'] - left['Resource'])
+                    if method == 'epsilon':
+                        # The front is concave: the tangents at both ends bound how far it can rise above
+                        # the chord, and they cross where the kink, if any, must be.
+                        bend = left['Slope'] - right['Slope']
+                        if bend <= 0:
+                            closed.add(key)
+                            continue
+                        knee = (right['Profit'] - left['Profit'] + left['Slope'] * left['Resource']
+                                - right['Slope'] * right['Resource']) / bend
+                        knee = min(max(knee, left['Resource']), right['Resource'])
+                        gap = left['Profit'] + left['Slope'] * (knee - left['Resource']) \
+                            - (left['Profit'] + chord * (knee - left['Resource']))
+                        if gap <= tol * scale:
+                            closed.add(key)
+                            continue
+                        candidates.append((knee, left['Basis'], key))
+                    else:
+                        # The weight equal to the chord slope finds any supported point above the chord
+                        candidates.append((chord, left['Basis'], key))
+
+                candidates = candidates[:max_points - len(front)]
+                if not candidates:
+                    break
+                new_points = _solve_pareto_parallel(executor, workers, scan, objective, method,
+                                                    [(t, basis) for t, basis, _ in candidates])
+                solves += len(candidates)
+
+                for (t, _, key), point in zip(candidates, new_points):
+                    left_resource, right_resource = key
+                    if point is None or not left_resource < point['Resource'] < right_resource:
+                        closed.add(key)
+                        continue
+                    if method == 'weighted':
+                        left = next(p for p in front if p['Resource'] == left_resource)
+                        if point['Profit'] - t * point['Resource'] <= left['Profit'] - t * left['Resource'] + tol * scale:
+                            closed.add(key)
+                            continue
+                    front.append(point)
+                front.sort(key=lambda p: p['Resource'])
+
+            # A point that earns no more than a cheaper one is dominated
+            kept = []
+            for point in front:
+                if not kept or point['Profit'] > kept[-1]['Profit'] + tol * scale:
+                    kept.append(point)
+            front = kept
+    finally:
+        _dispose_pareto_models(scan)
+
+    return {
+        'Products': [p['name'] for p in products],
+        'Parameter': np.array([p['Parameter'] for p in front]),
+        'Profit': np.array([p['Profit'] for p in front]),
+        'Resource': np.array([p['Resource'] for p in front]),
+        'Production Levels': np.array([p['Production Levels'] for p in front]).reshape(len(front), len(products)),
+        'Solves': solves,
+    }
+
+
+class LiveModel:
+    """
+    A knapsack or production planning model kept alive between solves, so that edits to single
+    items and constraints are applied in place instead of rebuilding the model every time.
+
+    Items are identified by their row index and constraints by their name. solve returns the same
+    results as solve_knapsack or solve_production.
+
+    The model has its own Gurobi environment, so it can be solved on a background thread while
+    other models are solved elsewhere. Call dispose once it is no longer needed.
+    """
+
+    def __init__(self, problem):
+        from gurobipy import Env, Model, GRB
+
+        if problem not in ('knapsack', 'production'):
+            raise ValueError(f"Unknown problem: {problem}")
+        self.problem = problem
+        self.env = Env(empty=True)
+        self.env.setParam('OutputFlag', 0)
+        self.env.start()
+        self.model = Model("knapsack" if problem == 'knapsack' else "Generic Production Planning", env=self.env)
+        self.model.ModelSense = GRB.MAXIMIZE
+        self.x = []
+        self.names = []
+        self.constrs = {}
+
+    def dispose(self):
+        self.model.dispose()
+        self.env.dispose()
+
+    def add_item(self):
+        from gurobipy import GRB
+
+        vtype = GRB.BINARY if self.problem == 'knapsack' else GRB.CONTINUOUS
+        self.x.append(self.model.addVar(vtype=vtype, name=f"x[{len(self.x)}]"))
+        self.names.append(f"Item {len(self.x)}")
+        self.model.update()
+
+    def set_name(self, row, name):
+        self.names[row] = name
+
+    def set_value(self, row, value):
+        self.x[row].Obj = value
+
+    def add_constraint(self, name):
+        from gurobipy import GRB, LinExpr
+
+        # The constraint stays inactive until its maximum is set
+        self.constrs[name] = self.model.addLConstr(LinExpr(), GRB.LESS_EQUAL, GRB.INFINITY, name)
+        self.model.update()
+
+    def remove_constraint(self, name):
+        self.model.remove(self.constrs.pop(name))
+
+    def set_coefficient(self, row, name, value):
+        self.model.chgCoeff(self.constrs[name], self.x[row], value)
+
+    def set_max(self, name, value):
+        self.constrs[name].RHS = value
+
+    def solve(self):
+        from gurobipy import GRB
+
+        # Gurobi restarts from the previous solution wherever the edits allow it
+        self.model.optimize()
+
+        if self.problem == 'knapsack':
+            if self.model.status == GRB.OPTIMAL:
+                selected_items = [i for i in range(len(self.x)) if self.x[i].X > 0.5]
+                return selected_items, self.model.objVal, self.model.Runtime
+            else:
+                return None
+        if self.model.status == GRB.OPTIMAL:
+            return {
+                'Production Levels': {name: v.X for name, v in zip(self.names, self.x)},
+                'Total Profit': self.model.objVal
+            }
+        else:
+            return None
+
 
-constraints = {
-    "material": {
-        "values": [2, 1],  # Material per unit (product A, B)
-        "max": 119.5,  # Slightly modified material availability
-    },
-    "processing_time": {
-        "values": [3, 2],  # Processing time per unit (product A, B)
-        "max": 165,  # Total processing time available
-    },
-}
+if __name__ == '__main__':
+    products = [
+        {"name": "Product A", "profit": 10},
+        {"name": "Product B", "profit": 15},
+    ]
 
-print(solve_production(products=products, constraints=constraints))
+    constraints = {
+        "material": {
+            "values": [2, 1],  # Material per unit (product A, B)
+            "max": 119.5,  # Slightly modified material availability
+        },
+        "processing_time": {
+            "values": [3, 2],  # Processing time per unit (product A, B)
+            "max": 165,  # Total processing time available
+        },
+    }
 
+    print(solve_production(products=products, constraints=constraints))
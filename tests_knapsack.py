@@ -1,6 +1,5 @@
-from optimization_solver import solve_knapsack, solve_production
-import pandas as pd
-from tabulate import tabulate
+from optimization_solver import solve_knapsack, solve_knapsack_scenarios, solve_production
+from instance_generator import KNAPSACK_KINDS, build_corpus, generate_knapsack, knapsack_dp, load_corpus
 
 
 def run_tests():
@@ -52,9 +51,123 @@ def run_tests():
     
     return results
 
-# Run the tests
-results = run_tests()
 
-# Analyze and present the results
-df = pd.DataFrame(results)
-print(tabulate(df, headers='keys', tablefmt='grid'))
\ No newline at end of file
+def run_scenario_tests():
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    values = [20, 30, 10, 50, 40, 70]
+    constraints = {
+        "weight": {"values": [2, 3, 1, 6, 7, 5], "max": 15},
+        "volume": {"values": [3, 2, 4, 1, 5, 6], "max": 10},
+    }
+    # 5000 scenarios of capacities spread around the nominal 'max'
+    nominal_max = np.array([data["max"] for data in constraints.values()], dtype=float)
+    capacities = nominal_max * rng.uniform(0.7, 1.3, size=(5000, len(constraints)))
+    # The same scenarios with item weights perturbed by up to 20%
+    nominal_weights = np.array([data["values"] for data in constraints.values()], dtype=float)
+    weights = nominal_weights * rng.uniform(0.8, 1.2, size=(5000,) + nominal_weights.shape)
+
+    results = []
+
+    for name, kwargs in [
+        ("Sample Average", {"mode": "saa"}),
+        ("Chance Constrained", {"mode": "chance", "alpha": 0.1}),
+        ("Uncertain Weights", {"mode": "chance", "alpha": 0.1, "weights": weights}),
+    ]:
+        result = solve_knapsack_scenarios(values, constraints, capacities, **kwargs)
+        results.append({
+            "Test Case": name,
+            "Selected Items": result["Selected Items"],
+            "Total Value": result["Total Value"],
+            "Feasibility": result["Feasibility"],
+            "Scenarios Used": result["Scenarios Used"],
+            "Runtime (s)": result["Runtime"]
+        })
+
+    return results
+
+
+def run_generated_tests():
+    results = []
+
+    # Hard single-constraint classes, checked against the dynamic programming optimum
+    for kind in KNAPSACK_KINDS:
+        if kind == "multi_constraint":
+            continue
+        values, constraints = generate_knapsack(kind, 200, seed=1)
+        selected_items, total_value, runtime = solve_knapsack(values, constraints, mip_gap=0)
+        (constraint_data,) = constraints.values()
+        optimum = knapsack_dp(values, constraint_data["values"], constraint_data["max"])
+        results.append({
+            "Test Case": kind,
+            "Total Value": total_value,
+            "Known Optimum": optimum,
+            "Match": round(total_value) == optimum,
+            "Runtime (s)": runtime
+        })
+
+    return results
+
+
+def run_corpus_tests():
+    import os
+    import tempfile
+
+    # Single-constraint instances only, their optima come from the dynamic program without Gurobi
+    specs = [
+        (f"knapsack_{kind}_30", "knapsack", {"kind": kind, "n_items": 30, "seed": 7})
+        for kind in KNAPSACK_KINDS if kind != "multi_constraint"
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.npz")
+        build_corpus(path, specs)
+        corpus = load_corpus(path)
+
+    results = []
+
+    for name, problem, kwargs in specs:
+        values, constraints = generate_knapsack(**kwargs)
+        (constraint_data,) = constraints.values()
+        optimum = knapsack_dp(values, constraint_data["values"], constraint_data["max"])
+        instance = corpus[name]
+        results.append({
+            "Test Case": name,
+            "Known Optimum": optimum,
+            "Stored Optimum": instance["optimum"],
+            "Match": (instance["problem"] == problem and instance["values"] == values
+                      and instance["constraint_values"] == constraints and instance["optimum"] == optimum)
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    import pandas as pd
+    from tabulate import tabulate
+
+    # Run the tests
+    results = run_tests()
+
+    # Analyze and present the results
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+
+    # Run the scenario tests
+    results = run_scenario_tests()
+
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+
+    # Run the generated hard instance tests
+    results = run_generated_tests()
+
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+
+    # Run the corpus round-trip tests
+    results = run_corpus_tests()
+
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
@@ -1,6 +1,4 @@
-from gurobipy import Model, GRB, quicksum
-import pandas as pd
-from tabulate import tabulate
+from optimization_solver import LiveModel, solve_production_pareto
 
 def solve_production(products, constraints):
     """
@@ -17,6 +15,8 @@ def solve_production(products, constraints):
     Returns:
         - A dictionary with production levels, the total profit, and the runtime.
     """
+    from gurobipy import Model, GRB, quicksum
+
     m = Model("Generic Production Planning")
 
     # Decision variables for production levels (consider using GRB.CONTINUOUS if applicable)
@@ -125,9 +125,138 @@ def run_production_tests():
     
     return results
 
-# Run the tests
-results = run_production_tests()
 
-# Analyze and present the results
-df = pd.DataFrame(results)
-print(tabulate(df, headers='keys', tablefmt='grid'))
+def run_pareto_tests():
+    test_cases = [
+        {
+            "name": "Cas Complexe",
+            "products": [
+                {"name": "Produit A", "profit": 10},
+                {"name": "Produit B", "profit": 15},
+                {"name": "Produit C", "profit": 20},
+                {"name": "Produit D", "profit": 25},
+            ],
+            "constraints": {
+                "matériaux": {"values": [2, 1, 3, 2], "max": 10},
+                "temps de traitement": {"values": [3, 2, 4, 1], "max": 10},
+                "coût de production": {"values": [1, 2, 1, 3], "max": 5},
+            }
+        },
+        {
+            # Same profit for A and B but B takes three times longer: at maximum profit the
+            # processing time is slack, and only the cheaper optimum (5) is on the front
+            "name": "Cas Profits Égaux",
+            "products": [
+                {"name": "Produit A", "profit": 10},
+                {"name": "Produit B", "profit": 10},
+            ],
+            "constraints": {
+                "matériaux": {"values": [1, 1], "max": 5},
+                "temps de traitement": {"values": [1, 3], "max": 100},
+            }
+        },
+    ]
+
+    results = []
+
+    for test in test_cases:
+        # The largest-resource end of the front is the plain maximum profit
+        max_profit = solve_production(test["products"], test["constraints"])["Total Profit"]
+        endpoints = []
+        case_results = []
+
+        for method in ["epsilon", "weighted"]:
+            front = solve_production_pareto(test["products"], test["constraints"], "temps de traitement",
+                                            method=method)
+            profit = front["Profit"]
+            resource = front["Resource"]
+            endpoints.append((profit[0], resource[0], profit[-1], resource[-1]))
+            case_results.append({
+                "Test Case": test["name"],
+                "Method": method,
+                "Points": len(profit),
+                "Solves": front["Solves"],
+                "Profit": profit.round(3).tolist(),
+                "Processing Time": resource.round(3).tolist(),
+                # Along a front without dominated points, more resource always buys strictly more profit
+                "Match": (bool((profit[1:] > profit[:-1]).all()) and bool((resource[1:] > resource[:-1]).all())
+                          and abs(profit[-1] - max_profit) < 1e-6)
+            })
+
+        # Both methods must span the front between the same two endpoints
+        same_endpoints = all(abs(a - b) < 1e-6 for a, b in zip(endpoints[0], endpoints[1]))
+        for result in case_results:
+            result["Same Endpoints"] = same_endpoints
+        results.extend(case_results)
+
+    return results
+
+
+def run_live_tests():
+    products = [
+        {"name": "Produit A", "profit": 10},
+        {"name": "Produit B", "profit": 15},
+    ]
+    constraints = {
+        "matériaux": {"values": [2, 1], "max": 8},
+        "temps de traitement": {"values": [3, 2], "max": 10},
+    }
+
+    model = LiveModel("production")
+    for row, product in enumerate(products):
+        model.add_item()
+        model.set_name(row, product["name"])
+        model.set_value(row, product["profit"])
+    for constraint_name, constraint_data in constraints.items():
+        model.add_constraint(constraint_name)
+        for row, value in enumerate(constraint_data["values"]):
+            model.set_coefficient(row, constraint_name, value)
+        model.set_max(constraint_name, constraint_data["max"])
+
+    # Each edit is applied to the kept-alive model and compared with a full rebuild
+    edits = [
+        ("Initial", None),
+        ("Profit B = 25", lambda: (model.set_value(1, 25), products[1].update(profit=25))),
+        ("Max matériaux = 4", lambda: (model.set_max("matériaux", 4), constraints["matériaux"].update(max=4))),
+        ("Remove temps de traitement", lambda: (model.remove_constraint("temps de traitement"),
+                                                constraints.pop("temps de traitement"))),
+    ]
+
+    results = []
+
+    for name, edit in edits:
+        if edit:
+            edit()
+        live = model.solve()
+        rebuilt = solve_production(products, constraints)
+        results.append({
+            "Edit": name,
+            "Live Profit": live["Total Profit"],
+            "Rebuilt Profit": rebuilt["Total Profit"],
+            "Match": abs(live["Total Profit"] - rebuilt["Total Profit"]) < 1e-6
+        })
+
+    return results
+
+if __name__ == '__main__':
+    import pandas as pd
+    from tabulate import tabulate
+
+    # Run the tests
+    results = run_production_tests()
+
+    # Analyze and present the results
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+
+    # Run the Pareto front tests
+    results = run_pareto_tests()
+
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))
+
+    # Run the live model tests
+    results = run_live_tests()
+
+    df = pd.DataFrame(results)
+    print(tabulate(df, headers='keys', tablefmt='grid'))